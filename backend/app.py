@@ -3,75 +3,246 @@ Flask Backend API for Quantum Molecule Energy Estimator
 Enhanced with comprehensive error handling, validation, logging, and performance optimizations
 """
 
-from flask import Flask, jsonify, send_file, request, Response, stream_with_context
-from flask_cors import CORS
-from quantum_engine import QuantumMoleculeEngine
+from flask import Flask, jsonify, send_file, redirect, request, g, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
+from quantum_engine import VQECancelled, save_figure
 from services.vqe_service import VQEService
 from services.hamiltonian_service import HamiltonianService
 from services.classical_service import ClassicalService
+from services.analytics_service import AnalyticsService
+from services.task_service import TaskService
+from services.engine_service import EngineService
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
 import os
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 from datetime import datetime
 from functools import wraps
+from operator import itemgetter
 import time
 import json
+import hashlib
+import tempfile
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
-from threading import Thread
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('backend.log'),
-        logging.StreamHandler()
-    ]
-)
+import threading
+from threading import Thread, Event
+
+# Configure logging: request threads only enqueue records, a listener thread does the I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('backend.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = Queue()
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the real format
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which serializes NumPy arrays and scalars natively"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-CORS(app)  # Enable CORS for React frontend
+app.json = ORJSONProvider(app)
+
+
+@app.before_request
+def start_request_timer():
+    """Record when the request started for the access log"""
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def log_response(response):
+    """Log each request with its status and handler duration"""
+    start = g.get('request_start')
+    if start is not None:
+        logger.info('%s %s from %s -> %d in %.3fs', request.method, request.path,
+                    request.remote_addr, response.status_code, time.perf_counter() - start)
+    return response
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Allow the React frontend to call the API from any origin"""
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['Access-Control-Allow-Methods'] = 'GET,POST,OPTIONS'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers['Access-Control-Expose-Headers'] = 'Content-Disposition'
+    return response
+
+
+# Transparent gzip/brotli for JSON and text responses (PNGs are already deflated)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/plain', 'text/csv']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
 
 # Configuration
 STATIC_DIR = 'static/plots'
 HAMILTONIAN_DIR = 'hamiltonians'
 CACHE_DIR = 'cache'
+PROFILE_DIR = 'profiles'
+
+_PLOT_PREFIX = STATIC_DIR.rstrip('/') + '/'
 
 os.makedirs(STATIC_DIR, exist_ok=True)
 os.makedirs(HAMILTONIAN_DIR, exist_ok=True)
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# FLASK_PROFILE=1 dumps a cProfile file per request (top 30 entries logged)
+if os.environ.get('FLASK_PROFILE'):
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, profile_dir=PROFILE_DIR, restrictions=[30])
+
 # Supported molecules configuration
 SUPPORTED_MOLECULES = ['H2', 'LiH']
+_SUPPORTED = frozenset(SUPPORTED_MOLECULES)
 MAX_ITERATIONS_LIMIT = 500
 MIN_ITERATIONS = 10
+MAX_OPTIMIZER_STARTS = 8
+MAX_ANALYTICS_POINTS = 200_000
+
+# Request body schemas: field -> (accepted types, default, minimum, maximum)
+VQE_PARAMS = {
+    'max_iter': (int, 100, MIN_ITERATIONS, MAX_ITERATIONS_LIMIT)
+}
+MULTI_OPTIMIZER_PARAMS = {
+    **VQE_PARAMS,
+    'num_starts': (int, 1, 1, MAX_OPTIMIZER_STARTS)
+}
+BOND_SCAN_PARAMS = {
+    'start': ((int, float), 0.5, 0.1, 5.0),
+    'end': ((int, float), 2.0, 0.1, 5.0),
+    'steps': (int, 10, 2, 50)
+}
+
+# Default browser cache lifetime for files sent with send_file
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# Reject oversized request bodies before they are parsed
+app.config['MAX_CONTENT_LENGTH'] = 1 << 20  # 1 MB
+
+# Static molecule metadata and theory notes, serialized once at import
+MOLECULE_METADATA = {
+    'H2': {
+        'name': 'H2',
+        'full_name': 'Hydrogen Molecule',
+        'formula': 'H₂',
+        'description': 'The simplest diatomic molecule',
+        'electrons': 2,
+        'atoms': 2,
+        'bond_length': 0.735,
+        'basis': 'sto3g',
+        'geometry': 'H 0.0 0.0 0.0; H 0.0 0.0 0.735',
+        'dissociation_energy': 4.52,
+        'point_group': 'D∞h',
+        'dipole_moment': 0.0
+    },
+    'LiH': {
+        'name': 'LiH',
+        'full_name': 'Lithium Hydride',
+        'formula': 'LiH',
+        'description': 'Heteronuclear diatomic with ionic character',
+        'electrons': 4,
+        'atoms': 2,
+        'bond_length': 1.596,
+        'basis': 'sto3g',
+        'geometry': 'Li 0.0 0.0 0.0; H 0.0 0.0 1.596',
+        'dissociation_energy': 2.43,
+        'point_group': 'C∞v',
+        'dipole_moment': 5.88
+    }
+}
+
+# Structure images are served through /api/molecule-image/<name>, not the molecule list
+MOLECULE_IMAGES = {
+    'H2': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Hydrogen_molecule.svg/320px-Hydrogen_molecule.svg.png',
+    'LiH': 'https://pubchem.ncbi.nlm.nih.gov/image/imgsrv.fcgi?cid=62714&t=l'
+}
+
+MOLECULE_THEORIES = {
+    'H2': {
+        'molecule': 'Hydrogen (H₂)',
+        'why_important': 'The simplest molecule in nature, perfect for validating quantum algorithms.',
+        'chemistry': 'Two hydrogen atoms share electrons in a covalent bond. Ground state energy determines bond stability.',
+        'vqe_approach': 'VQE uses a parameterized quantum circuit (ansatz) to prepare trial states. The circuit parameters are optimized classically to minimize energy expectation value.',
+        'hamiltonian': 'The molecular Hamiltonian is mapped to qubit operators using the parity transformation (with two-qubit symmetry reduction), converting fermionic operators to Pauli matrices.',
+        'convergence': 'Typically converges in 20-50 iterations with SLSQP optimizer, reaching chemical accuracy (~1 kcal/mol).'
+    },
+    'LiH': {
+        'molecule': 'Lithium Hydride (LiH)',
+        'why_important': 'Demonstrates VQE capability for heteronuclear molecules with more complex electronic structure.',
+        'chemistry': 'Ionic character with electron transfer from Li to H. More electrons mean richer electronic correlation.',
+        'vqe_approach': 'Requires more qubits and deeper circuits than H₂. The ansatz must capture both ionic and covalent character.',
+        'hamiltonian': 'Contains more Pauli terms due to increased electron interactions. Active space reduction often used for efficiency.',
+        'convergence': 'May require 50-100 iterations due to more complex energy landscape and higher dimensionality.'
+    }
+}
 
+_MOLECULES_JSON = orjson.dumps({
+    'success': True,
+    'molecules': list(MOLECULE_METADATA.values()),
+    'count': len(MOLECULE_METADATA)
+})
+_THEORY_JSON = {
+    name: orjson.dumps({'success': True, 'theory': theory})
+    for name, theory in MOLECULE_THEORIES.items()
+}
+_MOLECULES_ETAG = hashlib.sha1(_MOLECULES_JSON).hexdigest()
+_THEORY_ETAGS = {name: hashlib.sha1(body).hexdigest() for name, body in _THEORY_JSON.items()}
 
-# Decorators for enhanced functionality
-def log_request(f):
-    """Decorator to log API requests"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        start_time = time.time()
-        logger.info(f"Request: {request.method} {request.path} from {request.remote_addr}")
+# Content ETags for served plots, keyed by path and invalidated by mtime
+_plot_etags = {}
+
+# One reusable Agg figure per thread for potential energy surface plots (no pyplot state)
+_pes_figures = threading.local()
+
+# (refresh deadline, text) for response_timestamp(); swapped as one tuple
+_timestamp = (0.0, '')
+
+
+def _prewarm_engines():
+    """Build the equilibrium engines up front so the first requests are hot"""
+    for molecule_name in SUPPORTED_MOLECULES:
         try:
-            result = f(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.info(f"Completed: {request.path} in {duration:.2f}s")
-            return result
+            EngineService.get(molecule_name)
+            logger.info(f"Pre-warmed engine for {molecule_name}")
         except Exception as e:
-            logger.error(f"Error in {request.path}: {str(e)}", exc_info=True)
-            raise
-    return decorated_function
+            logger.warning(f"Could not pre-warm engine for {molecule_name}: {str(e)}")
 
 
+# Decorators for enhanced functionality
 def validate_molecule(f):
     """Decorator to validate molecule name"""
     @wraps(f)
     def decorated_function(molecule_name, *args, **kwargs):
-        if molecule_name not in SUPPORTED_MOLECULES:
+        if molecule_name not in _SUPPORTED:
             return jsonify({
                 'success': False,
                 'error': f'Unsupported molecule: {molecule_name}. Supported: {SUPPORTED_MOLECULES}'
@@ -86,6 +257,9 @@ def handle_errors(f):
     def decorated_function(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except HTTPException:
+            # Let Flask's error handlers (e.g. the JSON 413) answer these
+            raise
         except ValueError as e:
             logger.warning(f"Validation error: {str(e)}")
             return jsonify({'success': False, 'error': str(e)}), 400
@@ -98,69 +272,269 @@ def handle_errors(f):
     return decorated_function
 
 
+def json_body():
+    """The request's JSON object body; malformed, non-JSON or non-object bodies are a ValueError"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise ValueError('Request body must be a JSON object')
+    return data
+
+
+def parse_params(schema):
+    """Read the JSON body fields in a schema, applying defaults and range checks"""
+    data = json_body()
+    
+    values = {}
+    for name, (types, default, minimum, maximum) in schema.items():
+        value = data.get(name, default)
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError(f"{name} must be {'an integer' if types is int else 'a number'}")
+        if not minimum <= value <= maximum:
+            raise ValueError(f'{name} must be between {minimum} and {maximum}')
+        values[name] = value
+    return values
+
+
+def iteration_energies(iterations):
+    """Energies of a list of iteration records ({'energy': number, ...}) as a float64 array"""
+    if not isinstance(iterations, list):
+        raise ValueError('iterations must be a list of iteration records')
+    try:
+        energies = np.fromiter(map(itemgetter('energy'), iterations), dtype=np.float64, count=len(iterations))
+    except (KeyError, IndexError, TypeError, ValueError):
+        energies = None
+    # None converts to NaN rather than failing, so check finiteness too
+    if energies is None or not np.isfinite(energies).all():
+        raise ValueError('each iteration must be an object with a numeric energy')
+    return energies
+
+
+@app.errorhandler(413)
+def payload_too_large(e):
+    """Return a JSON error when the body exceeds MAX_CONTENT_LENGTH"""
+    return jsonify({
+        'success': False,
+        'error': f"Request body exceeds {app.config['MAX_CONTENT_LENGTH']} bytes"
+    }), 413
+
+
+def static_json_response(body, etag):
+    """Serve an immutable pre-serialized JSON body with a strong ETag"""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+def response_timestamp():
+    """ISO timestamp for response bodies, reformatted at most every 100 ms"""
+    global _timestamp
+    refresh_at, text = _timestamp
+    now = time.monotonic()
+    if now >= refresh_at:
+        text = datetime.now().isoformat()
+        _timestamp = (now + 0.1, text)
+    return text
+
+
+def sse_frame(payload):
+    """Encode one Server-Sent Events data frame as UTF-8 bytes"""
+    return b'data: ' + orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n\n'
+
+
+class IterationFeed:
+    """(eval_count, energy) updates handed from a VQE thread to the SSE generator
+    
+    The optimizer only appends to a list, so it never blocks on a slow client; the
+    generator wakes up and takes every update that arrived since its last look.
+    """
+    
+    def __init__(self):
+        self._updates = []
+        self._ready = Event()
+        self._closed = False
+    
+    def push(self, eval_count, energy):
+        self._updates.append((eval_count, energy))
+        self._ready.set()
+    
+    def close(self):
+        self._closed = True
+        self._ready.set()
+    
+    def batches(self):
+        """Yield lists of new updates until the feed is closed and drained"""
+        seen = 0
+        while True:
+            self._ready.wait()
+            self._ready.clear()
+            closed = self._closed  # Read before slicing so no update pushed before close is missed
+            batch = self._updates[seen:]
+            seen += len(batch)
+            if batch:
+                yield batch
+            if closed:
+                return
+
+
+# The "running" frames of the VQE stream only vary by molecule, so render them once
+_STREAM_FRAMES = {
+    molecule_name: {
+        'initialize': sse_frame({'step': 'initialize', 'status': 'running', 'message': f'Initializing quantum engine for {molecule_name}...', 'progress': 0}),
+        'hamiltonian': sse_frame({'step': 'hamiltonian', 'status': 'running', 'message': 'Running PySCF Hartree-Fock calculation...', 'progress': 15}),
+        'circuit': sse_frame({'step': 'circuit', 'status': 'running', 'message': 'Constructing Hartree-Fock initial state + variational ansatz...', 'progress': 35}),
+        'vqe': sse_frame({'step': 'vqe', 'status': 'running', 'message': 'Starting VQE optimization with SLSQP...', 'progress': 50}),
+        'results': sse_frame({'step': 'results', 'status': 'running', 'message': 'Generating plots and analysis...', 'progress': 92}),
+    }
+    for molecule_name in SUPPORTED_MOLECULES
+}
+
+# Fixed-schema iteration frame, filled in per optimizer evaluation
+_ITERATION_FRAME = b'data: {"step":"vqe","status":"iterating","data":{"iteration":%d,"energy":%r},"progress":%d}\n\n'
+
+# Compact alternative (?compact=1): a named "iteration" event carrying "iteration,energy,progress"
+_COMPACT_ITERATION_FRAME = b'event: iteration\ndata: %d,%r,%d\n\n'
+
+
+def run_job(job, *args, **kwargs):
+    """Run a long simulation inline, or in the background when ?async=1 is passed"""
+    if request.args.get('async') == '1':
+        task_id = TaskService.submit(job, *args, **kwargs)
+        return jsonify({
+            'success': True,
+            'task_id': task_id,
+            'status_url': f'/api/task/{task_id}'
+        }), 202
+    
+    result = job(*args, **kwargs)
+    if result['success']:
+        return jsonify(result)
+    else:
+        return jsonify(result), 400
+
+
+def _vqe_job(molecule_name, max_iter):
+    """Full VQE simulation with plots"""
+    result = VQEService.run_simulation(molecule_name, STATIC_DIR, max_iter=max_iter, hamiltonian_dir=HAMILTONIAN_DIR)
+    if result['success']:
+        result['timestamp'] = response_timestamp()
+    return result
+
+
+def _multi_optimizer_job(molecule_name, max_iter, num_starts):
+    """VQE comparison across optimizers"""
+    engine = EngineService.get(molecule_name)
+    result = engine.run_multi_optimizer_vqe(max_iter=max_iter, num_starts=num_starts)
+    if result['success']:
+        result['timestamp'] = response_timestamp()
+    return result
+
+
+def _get_pes_figure():
+    """Return this thread's PES figure, cleared and ready to draw on"""
+    fig = getattr(_pes_figures, 'figure', None)
+    if fig is None:
+        fig = Figure(figsize=(10, 6), constrained_layout=True)
+        FigureCanvasAgg(fig)
+        _pes_figures.figure = fig
+    fig.clf()
+    return fig
+
+
+def _draw_pes_series(ax, bond_lengths, energies, color, marker, label):
+    """Draw one PES curve as a single LineCollection (markers only for short scans)"""
+    x = np.asarray(bond_lengths, dtype=np.float64)
+    y = np.asarray(energies, dtype=np.float64)  # failed points (None) become NaN gaps
+    points = np.column_stack((x, y))
+    segments = np.stack((points[:-1], points[1:]), axis=1)
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=2, label=label))
+    if len(x) <= 30:
+        ax.scatter(x, y, c=color, marker=marker, s=36, zorder=3)
+
+
+def _bond_scan_job(molecule_name, start, end, steps, refresh=False):
+    """Potential energy surface scan with PES plot"""
+    # Scans are deterministic, so reuse a previous run with the same parameters
+    # (normalized first, so a JSON 2 and 2.0 share one cache entry)
+    start, end, steps = float(start), float(end), int(steps)
+    key = hashlib.sha1(f'{molecule_name}|{start}|{end}|{steps}'.encode()).hexdigest()[:16]
+    pes_filename = f'{molecule_name}_pes_{key}.png'
+    pes_path = f'{_PLOT_PREFIX}{pes_filename}'
+    result_path = os.path.join(CACHE_DIR, f'pes_{key}.json')
+    
+    if not refresh and os.path.exists(pes_path) and os.path.exists(result_path):
+        with open(result_path, 'r') as f:
+            result = json.load(f)
+        result['timestamp'] = response_timestamp()
+        return result
+    
+    engine = EngineService.get(molecule_name)
+    result = engine.scan_bond_length(start=start, end=end, steps=steps)
+    if not result['success']:
+        return result
+    
+    # Generate PES plot
+    fig = _get_pes_figure()
+    ax = fig.add_subplot(111)
+    ax.ticklabel_format(useOffset=False)
+    _draw_pes_series(ax, result['bond_lengths'], result['classical_energies'], 'r', 'o', 'Classical (HF)')
+    _draw_pes_series(ax, result['bond_lengths'], result['vqe_energies'], 'b', 's', 'VQE')
+    ax.autoscale_view()
+    ax.set_xlabel('Bond Length (Å)', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Energy (Hartree)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Potential Energy Surface - {molecule_name}', fontsize=14, fontweight='bold')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    save_figure(fig, pes_path, dpi=150, bbox_inches='tight')
+    
+    result['pes_plot'] = f'/static/plots/{pes_filename}'
+    # Written beside the target and renamed, so a concurrent request never reads partial JSON
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(result, f)
+    os.replace(tmp_path, result_path)
+    
+    result['timestamp'] = response_timestamp()
+    return result
+
+
 @app.route('/api/molecules', methods=['GET'])
-@log_request
 @handle_errors
 def get_molecules():
     """Get list of available molecules with their properties"""
-    molecules = {
-        'H2': {
-            'name': 'H2',
-            'full_name': 'Hydrogen Molecule',
-            'formula': 'H₂',
-            'description': 'The simplest diatomic molecule',
-            'electrons': 2,
-            'atoms': 2,
-            'bond_length': 0.735,
-            'basis': 'sto3g',
-            'geometry': 'H 0.0 0.0 0.0; H 0.0 0.0 0.735',
-            'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Hydrogen_molecule.svg/320px-Hydrogen_molecule.svg.png',
-            'dissociation_energy': 4.52,
-            'point_group': 'D∞h',
-            'dipole_moment': 0.0
-        },
-        'LiH': {
-            'name': 'LiH',
-            'full_name': 'Lithium Hydride',
-            'formula': 'LiH',
-            'description': 'Heteronuclear diatomic with ionic character',
-            'electrons': 4,
-            'atoms': 2,
-            'bond_length': 1.596,
-            'basis': 'sto3g',
-            'geometry': 'Li 0.0 0.0 0.0; H 0.0 0.0 1.596',
-            'image_url': 'https://pubchem.ncbi.nlm.nih.gov/image/imgsrv.fcgi?cid=62714&t=l',
-            'dissociation_energy': 2.43,
-            'point_group': 'C∞v',
-            'dipole_moment': 5.88
-        }
-    }
-    
-    return jsonify({
-        'success': True,
-        'molecules': list(molecules.values()),
-        'count': len(molecules)
-    })
+    return static_json_response(_MOLECULES_JSON, _MOLECULES_ETAG)
+
+
+@app.route('/api/molecule-image/<molecule_name>', methods=['GET'])
+@validate_molecule
+def get_molecule_image(molecule_name):
+    """Redirect to the molecule's structure image"""
+    response = redirect(MOLECULE_IMAGES[molecule_name])
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
 
 
 @app.route('/api/molecule/<molecule_name>', methods=['GET'])
-@log_request
 @validate_molecule
 @handle_errors
 def get_molecule_info(molecule_name):
     """Get detailed information about a specific molecule"""
-    engine = QuantumMoleculeEngine(molecule_name)
+    engine = EngineService.get(molecule_name)
     info = engine.get_molecule_info()
     
     return jsonify({
         'success': True,
         'molecule': info,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': response_timestamp()
     })
 
 
 @app.route('/api/hamiltonian/<molecule_name>', methods=['GET'])
-@log_request
 @validate_molecule
 @handle_errors
 def get_hamiltonian(molecule_name):
@@ -172,297 +546,265 @@ def get_hamiltonian(molecule_name):
             'success': True,
             'molecule': molecule_name,
             'hamiltonian': result['data'],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': response_timestamp()
         })
     else:
         return jsonify(result), 400
 
 
 @app.route('/api/circuit/<molecule_name>', methods=['GET'])
-@log_request
 @validate_molecule
 @handle_errors
 def get_circuit(molecule_name):
     """Generate and return circuit diagram"""
-    engine = QuantumMoleculeEngine(molecule_name)
-    engine.build_hamiltonian()
+    engine = EngineService.get(molecule_name)
     
-    circuit_path = os.path.join(STATIC_DIR, f'{molecule_name}_circuit.png')
+    circuit_path = f'{_PLOT_PREFIX}{molecule_name}_circuit.png'
     result = engine.generate_circuit_image(circuit_path)
     
     if result['success']:
         return jsonify({
             'success': True,
             'circuit_url': f'/static/plots/{molecule_name}_circuit.png',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': response_timestamp()
         })
     else:
         return jsonify(result), 400
 
 
 @app.route('/api/run-vqe/<molecule_name>', methods=['POST'])
-@log_request
 @validate_molecule
 @handle_errors
 def run_vqe(molecule_name):
     """Run VQE simulation for a molecule"""
-    # Get and validate parameters from request body
-    data = request.get_json() or {}
-    max_iter = data.get('max_iter', 100)
-    
-    # Validate max_iter
-    if not isinstance(max_iter, int) or max_iter < MIN_ITERATIONS or max_iter > MAX_ITERATIONS_LIMIT:
-        raise ValueError(f'max_iter must be between {MIN_ITERATIONS} and {MAX_ITERATIONS_LIMIT}')
+    max_iter = parse_params(VQE_PARAMS)['max_iter']
     
     logger.info(f"Running VQE for {molecule_name} with max_iter={max_iter}")
     
-    result = VQEService.run_simulation(molecule_name, STATIC_DIR, max_iter=max_iter)
-    
-    if result['success']:
-        result['timestamp'] = datetime.now().isoformat()
-        return jsonify(result)
-    else:
-        return jsonify(result), 400
+    return run_job(_vqe_job, molecule_name, max_iter)
 
 
 @app.route('/api/theory/<molecule_name>', methods=['GET'])
 def get_theory(molecule_name):
     """Get theory explanation for a molecule"""
-    theories = {
-        'H2': {
-            'molecule': 'Hydrogen (H₂)',
-            'why_important': 'The simplest molecule in nature, perfect for validating quantum algorithms.',
-            'chemistry': 'Two hydrogen atoms share electrons in a covalent bond. Ground state energy determines bond stability.',
-            'vqe_approach': 'VQE uses a parameterized quantum circuit (ansatz) to prepare trial states. The circuit parameters are optimized classically to minimize energy expectation value.',
-            'hamiltonian': 'The molecular Hamiltonian is mapped to qubit operators using Jordan-Wigner transformation, converting fermionic operators to Pauli matrices.',
-            'convergence': 'Typically converges in 20-50 iterations with SLSQP optimizer, reaching chemical accuracy (~1 kcal/mol).'
-        },
-        'LiH': {
-            'molecule': 'Lithium Hydride (LiH)',
-            'why_important': 'Demonstrates VQE capability for heteronuclear molecules with more complex electronic structure.',
-            'chemistry': 'Ionic character with electron transfer from Li to H. More electrons mean richer electronic correlation.',
-            'vqe_approach': 'Requires more qubits and deeper circuits than H₂. The ansatz must capture both ionic and covalent character.',
-            'hamiltonian': 'Contains more Pauli terms due to increased electron interactions. Active space reduction often used for efficiency.',
-            'convergence': 'May require 50-100 iterations due to more complex energy landscape and higher dimensionality.'
-        }
-    }
-    
-    theory = theories.get(molecule_name, theories['H2'])
+    if molecule_name not in _THEORY_JSON:
+        molecule_name = 'H2'
+    return static_json_response(_THEORY_JSON[molecule_name], _THEORY_ETAGS[molecule_name])
+
+
+def _plot_etag(filepath, mtime):
+    """Content hash of a plot file, recomputed only when its mtime changes"""
+    cached = _plot_etags.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     
-    return jsonify({
-        'success': True,
-        'theory': theory
-    })
+    with open(filepath, 'rb') as f:
+        etag = hashlib.md5(f.read()).hexdigest()
+    _plot_etags[filepath] = (mtime, etag)
+    return etag
 
 
 @app.route('/static/plots/<filename>', methods=['GET'])
 def serve_plot(filename):
-    """Serve generated plot images"""
-    filepath = os.path.join(STATIC_DIR, filename)
-    
-    if os.path.exists(filepath):
-        return send_file(filepath, mimetype='image/png')
-    else:
+    """Serve generated plot images (supports conditional GET)"""
+    if '/' in filename or '\\' in filename or '..' in filename:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid filename'
+        }), 400
+    
+    filepath = os.path.abspath(f'{_PLOT_PREFIX}{filename}')
+    # A simulation may have just queued this plot for rendering
+    VQEService.wait_for_render(filepath)
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
         return jsonify({
             'success': False,
             'error': 'File not found'
         }), 404
+    
+    # PES plots are content-addressed by their scan parameters and never change;
+    # other plots are overwritten in place, so clients must revalidate them
+    max_age = None if '_pes_' in filename else 0
+    return send_file(filepath, mimetype='image/png', conditional=True,
+                     etag=_plot_etag(filepath, mtime), last_modified=mtime, max_age=max_age)
 
 
 @app.route('/api/multi-optimizer/<molecule_name>', methods=['POST'])
-@log_request
 @validate_molecule
 @handle_errors
 def run_multi_optimizer(molecule_name):
     """Run VQE with multiple optimizers for comparison"""
-    data = request.get_json() or {}
-    max_iter = data.get('max_iter', 100)
-    
-    if not isinstance(max_iter, int) or max_iter < MIN_ITERATIONS or max_iter > MAX_ITERATIONS_LIMIT:
-        raise ValueError(f'max_iter must be between {MIN_ITERATIONS} and {MAX_ITERATIONS_LIMIT}')
+    params = parse_params(MULTI_OPTIMIZER_PARAMS)
+    max_iter, num_starts = params['max_iter'], params['num_starts']
     
-    logger.info(f"Running multi-optimizer comparison for {molecule_name}")
+    logger.info(f"Running multi-optimizer comparison for {molecule_name} ({num_starts} start(s) per optimizer)")
     
-    engine = QuantumMoleculeEngine(molecule_name)
-    engine.build_hamiltonian()
-    
-    result = engine.run_multi_optimizer_vqe(max_iter=max_iter)
-    
-    if result['success']:
-        result['timestamp'] = datetime.now().isoformat()
-        return jsonify(result)
-    else:
-        return jsonify(result), 400
+    return run_job(_multi_optimizer_job, molecule_name, max_iter, num_starts)
 
 
 @app.route('/api/bond-scan/<molecule_name>', methods=['POST'])
-@log_request
 @validate_molecule
 @handle_errors
 def bond_length_scan(molecule_name):
     """Scan potential energy surface by varying bond length"""
-    data = request.get_json() or {}
-    start = data.get('start', 0.5)
-    end = data.get('end', 2.0)
-    steps = data.get('steps', 10)
+    params = parse_params(BOND_SCAN_PARAMS)
+    start, end, steps = params['start'], params['end'], params['steps']
     
-    # Validation
-    if not (0.1 <= start <= end <= 5.0):
-        raise ValueError('Invalid bond length range. Must be between 0.1 and 5.0 Å')
-    if not (2 <= steps <= 50):
-        raise ValueError('Steps must be between 2 and 50')
+    if start >= end:
+        raise ValueError('Invalid bond length range. start must be less than end')
     
     logger.info(f"Running bond scan for {molecule_name}: {start}-{end} Å in {steps} steps")
     
-    engine = QuantumMoleculeEngine(molecule_name)
-    result = engine.scan_bond_length(start=start, end=end, steps=steps)
-    
-    if result['success']:
-        # Generate PES plot
-        plt.figure(figsize=(10, 6))
-        plt.plot(result['bond_lengths'], result['classical_energies'], 
-                'r-o', label='Classical (HF)', linewidth=2, markersize=6)
-        plt.plot(result['bond_lengths'], result['vqe_energies'], 
-                'b-s', label='VQE', linewidth=2, markersize=6)
-        plt.xlabel('Bond Length (Å)', fontsize=12, fontweight='bold')
-        plt.ylabel('Energy (Hartree)', fontsize=12, fontweight='bold')
-        plt.title(f'Potential Energy Surface - {molecule_name}', fontsize=14, fontweight='bold')
-        plt.legend(fontsize=11)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        pes_path = os.path.join(STATIC_DIR, f'{molecule_name}_pes.png')
-        plt.savefig(pes_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        
-        result['pes_plot'] = f'/static/plots/{molecule_name}_pes.png'
-        result['timestamp'] = datetime.now().isoformat()
-        return jsonify(result)
-    else:
-        return jsonify(result), 400
+    refresh = request.args.get('refresh') == '1'
+    return run_job(_bond_scan_job, molecule_name, start, end, steps, refresh=refresh)
 
 
 @app.route('/api/advanced-analytics/<molecule_name>', methods=['POST'])
-@log_request
 @validate_molecule
 @handle_errors
 def advanced_analytics(molecule_name):
     """Get advanced analytics for VQE simulation"""
-    data = request.get_json() or {}
+    data = json_body()
     iterations = data.get('iterations', [])
+    # Clients may send a flat 'energies' column instead of iteration records
+    energies = data.get('energies')
+    if energies is not None and not isinstance(energies, list):
+        raise ValueError('energies must be a list of numbers')
+    if not isinstance(iterations, list):
+        raise ValueError('iterations must be a list of iteration records')
     
-    if not iterations:
-        raise ValueError('No iteration data provided')
-    
-    energies = [item['energy'] for item in iterations]
-    
-    # Calculate comprehensive analytics
-    analytics = {
-        'mean_energy': float(np.mean(energies)),
-        'std_deviation': float(np.std(energies)),
-        'variance': float(np.var(energies)),
-        'min_energy': float(np.min(energies)),
-        'max_energy': float(np.max(energies)),
-        'energy_range': float(np.max(energies) - np.min(energies)),
-        'convergence_rate': None,
-        'final_gradient': None,
-        'median_energy': float(np.median(energies)),
-        'energy_improvement': None
-    }
-    
-    # Calculate convergence rate (last 10% of iterations)
-    if len(energies) > 10:
-        last_10_percent = energies[-len(energies)//10:]
-        analytics['convergence_rate'] = float(np.std(last_10_percent))
+    if len(energies or iterations) > MAX_ANALYTICS_POINTS:
+        raise ValueError(f'At most {MAX_ANALYTICS_POINTS} iterations can be analysed')
     
-    # Estimate gradient
-    if len(energies) > 2:
-        analytics['final_gradient'] = float(energies[-1] - energies[-2])
-    
-    # Calculate energy improvement
-    if len(energies) > 1:
-        analytics['energy_improvement'] = float(energies[0] - energies[-1])
+    if energies:
+        try:
+            energies = np.asarray(energies, dtype=np.float64)
+        except (TypeError, ValueError):
+            energies = None
+        if energies is None or energies.ndim != 1:
+            raise ValueError('energies must be a list of numbers')
+    elif iterations:
+        energies = iteration_energies(iterations)
+    else:
+        raise ValueError('No iteration data provided')
+    analytics = AnalyticsService.summarize(energies)
     
     return jsonify({
         'success': True,
         'analytics': analytics,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': response_timestamp()
     })
 
 
 @app.route('/api/compare-molecules', methods=['POST'])
-@log_request
 @handle_errors
 def compare_molecules():
     """Compare properties of multiple molecules"""
-    data = request.get_json() or {}
+    data = json_body()
     molecules = data.get('molecules', SUPPORTED_MOLECULES)
     
     # Validate molecules
-    for mol in molecules:
-        if mol not in SUPPORTED_MOLECULES:
-            raise ValueError(f'Unsupported molecule: {mol}')
+    if not isinstance(molecules, list) or not all(isinstance(mol, str) for mol in molecules):
+        raise ValueError('molecules must be a list of molecule names')
+    unsupported = set(molecules) - _SUPPORTED
+    if unsupported:
+        raise ValueError(f'Unsupported molecule(s): {", ".join(sorted(unsupported))}')
+    
+    def summarize(mol):
+        try:
+            engine = EngineService.get(mol)
+        except RuntimeError as e:
+            logger.warning(str(e))
+            return None
+        ham_result = engine.ham_result
+        return {
+            'num_qubits': ham_result['num_qubits'],
+            'num_terms': ham_result['num_terms'],
+            'classical_energy': ham_result['classical_energy'],
+            'info': engine.get_molecule_info()
+        }
     
+    # Uncached Hamiltonians are built side by side (PySCF spends its time in BLAS)
+    molecules = list(dict.fromkeys(molecules))
     comparison = {}
-    for mol in molecules:
-        engine = QuantumMoleculeEngine(mol)
-        ham_result = engine.build_hamiltonian()
-        if ham_result['success']:
-            comparison[mol] = {
-                'num_qubits': ham_result['num_qubits'],
-                'num_terms': ham_result['num_terms'],
-                'classical_energy': ham_result['classical_energy'],
-                'info': engine.get_molecule_info()
-            }
+    if molecules:
+        with ThreadPoolExecutor(max_workers=len(molecules)) as executor:
+            for mol, summary in zip(molecules, executor.map(summarize, molecules)):
+                if summary is not None:
+                    comparison[mol] = summary
     
     return jsonify({
         'success': True,
         'comparison': comparison,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': response_timestamp()
     })
 
 
 @app.route('/api/export-results', methods=['POST'])
-@log_request
 @handle_errors
 def export_results():
     """Export VQE results in various formats"""
-    data = request.get_json() or {}
+    data = json_body()
     format_type = data.get('format', 'json')  # json, csv, or txt
     results = data.get('results', {})
     
     if not results:
         raise ValueError('No results data provided')
+    if not isinstance(results, dict):
+        raise ValueError('results must be a JSON object')
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"vqe_results_{timestamp}"
     
     if format_type == 'json':
-        filepath = os.path.join(CACHE_DIR, f'{filename}.json')
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2)
+        body = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        mimetype = 'application/json'
     elif format_type == 'csv':
-        filepath = os.path.join(CACHE_DIR, f'{filename}.csv')
-        if 'iterations' in results:
-            import csv
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Iteration', 'Energy'])
-                for item in results['iterations']:
-                    writer.writerow([item['iteration'], item['energy']])
+        iterations = results.get('iterations') or []
+        # Check every row before streaming: once the 200 is sent a bad row can only truncate the file
+        iteration_energies(iterations)
+        if any(isinstance(item.get('iteration'), bool) or not isinstance(item.get('iteration'), (int, float))
+               for item in iterations):
+            raise ValueError('each iteration must have a numeric iteration number')
+        
+        def generate():
+            yield 'Iteration,Energy\r\n'
+            for item in iterations:
+                yield f"{item['iteration']},{item['energy']}\r\n"
+        
+        body = stream_with_context(generate())
+        mimetype = 'text/csv'
     else:
         raise ValueError(f'Unsupported format: {format_type}')
     
-    return jsonify({
-        'success': True,
-        'filename': filename,
-        'path': filepath,
-        'timestamp': datetime.now().isoformat()
+    # Stream straight back to the client instead of writing to CACHE_DIR first
+    return Response(body, mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename={filename}.{format_type}'
     })
 
 
+@app.route('/api/task/<task_id>', methods=['GET'])
+def get_task(task_id):
+    """Poll a background simulation started with ?async=1"""
+    status = TaskService.get_status(task_id)
+    
+    if status is None:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown task: {task_id}'
+        }), 404
+    
+    # A finished job can still have failed on its own terms (e.g. a VQE error)
+    if status['status'] == 'complete':
+        status['success'] = bool(status['result'].get('success', True))
+    else:
+        status['success'] = status['status'] != 'failed'
+    return jsonify(status)
+
+
 @app.route('/api/health', methods=['GET'])
-@log_request
 def health_check():
     """Health check endpoint with system status"""
     import sys
@@ -473,12 +815,11 @@ def health_check():
         'version': '2.0.0',
         'python_version': sys.version,
         'supported_molecules': SUPPORTED_MOLECULES,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': response_timestamp()
     })
 
 
 @app.route('/api/run-vqe-stream/<molecule_name>', methods=['GET'])
-@log_request
 @validate_molecule
 def run_vqe_stream(molecule_name):
     """Stream VQE simulation progress in real-time using Server-Sent Events"""
@@ -487,101 +828,107 @@ def run_vqe_stream(molecule_name):
         try:
             # Get parameters from URL query string (SSE only supports GET)
             max_iter = request.args.get('max_iter', 100, type=int)
+            iteration_frame = _COMPACT_ITERATION_FRAME if request.args.get('compact') == '1' else _ITERATION_FRAME
             
             # Validate max_iter
             if not isinstance(max_iter, int) or max_iter < MIN_ITERATIONS or max_iter > MAX_ITERATIONS_LIMIT:
-                yield f"data: {json.dumps({'error': f'max_iter must be between {MIN_ITERATIONS} and {MAX_ITERATIONS_LIMIT}'})}\n\n"
+                yield sse_frame({'error': f'max_iter must be between {MIN_ITERATIONS} and {MAX_ITERATIONS_LIMIT}'})
                 return
             
             logger.info(f"Starting real-time VQE stream for {molecule_name}")
             
             # STEP 1: Initialize
-            yield f"data: {json.dumps({'step': 'initialize', 'status': 'running', 'message': f'Initializing quantum engine for {molecule_name}...', 'progress': 0})}\n\n"
-            time.sleep(0.5)
+            frames = _STREAM_FRAMES[molecule_name]
+            yield frames['initialize']
             
-            engine = QuantumMoleculeEngine(molecule_name)
+            engine = EngineService.get(molecule_name)
             molecule_data = engine.molecule_data
             
-            yield f"data: {json.dumps({'step': 'initialize', 'status': 'complete', 'data': {'molecule': molecule_name, 'electrons': molecule_data['electrons'], 'atoms': molecule_data['atoms'], 'bond_length': molecule_data['bond_length']}, 'progress': 10})}\n\n"
-            time.sleep(0.3)
+            yield sse_frame({'step': 'initialize', 'status': 'complete', 'data': {'molecule': molecule_name, 'electrons': molecule_data['electrons'], 'atoms': molecule_data['atoms'], 'bond_length': molecule_data['bond_length']}, 'progress': 10})
             
             # STEP 2: Build Hamiltonian
-            yield f"data: {json.dumps({'step': 'hamiltonian', 'status': 'running', 'message': 'Running PySCF Hartree-Fock calculation...', 'progress': 15})}\n\n"
-            time.sleep(0.5)
+            yield frames['hamiltonian']
             
-            ham_result = engine.build_hamiltonian()
-            if not ham_result['success']:
-                yield f"data: {json.dumps({'error': ham_result['error']})}\n\n"
-                return
+            ham_result = engine.ham_result
             
-            yield f"data: {json.dumps({'step': 'hamiltonian', 'status': 'complete', 'data': {'num_qubits': ham_result['num_qubits'], 'num_terms': ham_result['num_terms'], 'classical_energy': ham_result['classical_energy'], 'pauli_terms': ham_result['pauli_terms'][:5]}, 'progress': 30})}\n\n"
-            time.sleep(0.5)
+            yield sse_frame({'step': 'hamiltonian', 'status': 'complete', 'data': {'num_qubits': ham_result['num_qubits'], 'num_terms': ham_result['num_terms'], 'classical_energy': ham_result['classical_energy'], 'pauli_terms': ham_result['pauli_terms'][:5]}, 'progress': 30})
             
             # STEP 3: Build Circuit
-            yield f"data: {json.dumps({'step': 'circuit', 'status': 'running', 'message': 'Constructing Hartree-Fock initial state + variational ansatz...', 'progress': 35})}\n\n"
-            time.sleep(0.5)
+            yield frames['circuit']
             
             # Generate circuit image
-            circuit_path = os.path.join(STATIC_DIR, f'{molecule_name}_circuit.png')
+            circuit_path = f'{_PLOT_PREFIX}{molecule_name}_circuit.png'
             engine.generate_circuit_image(circuit_path)
             
+            ansatz = engine.create_ansatz()
             circuit_info = {
                 'num_qubits': engine.hamiltonian.num_qubits,
-                'num_parameters': engine.create_ansatz().num_parameters if hasattr(engine.create_ansatz(), 'num_parameters') else 'N/A',
+                'num_parameters': getattr(ansatz, 'num_parameters', 'N/A'),
                 'circuit_url': f'/static/plots/{molecule_name}_circuit.png',
                 'ansatz_type': 'HartreeFock + TwoLocal (RY, RZ, CX)',
                 'entanglement': 'Linear'
             }
             
-            yield f"data: {json.dumps({'step': 'circuit', 'status': 'complete', 'data': circuit_info, 'progress': 45})}\n\n"
-            time.sleep(0.5)
+            yield sse_frame({'step': 'circuit', 'status': 'complete', 'data': circuit_info, 'progress': 45})
             
             # STEP 4: VQE Optimization (with real-time iteration updates)
-            yield f"data: {json.dumps({'step': 'vqe', 'status': 'running', 'message': 'Starting VQE optimization with SLSQP...', 'progress': 50})}\n\n"
-            time.sleep(0.5)
+            yield frames['vqe']
             
-            # Create a custom callback to stream iterations
-            iteration_count = [0]  # Use list to allow modification in callback
-            last_energy = [0.0]
+            # Run VQE in a worker thread; its callback feeds iterations to this generator live
+            feed = IterationFeed()
+            cancelled = Event()
+            outcome = {}
             
             def streaming_callback(eval_count, params, value, metadata):
-                iteration_count[0] = eval_count
-                last_energy[0] = float(value)
-                
-                # Stream iteration data
-                iteration_progress = 50 + int((eval_count / max_iter) * 40)
-                # This won't work in SSE context, so we'll collect iterations and send periodically
+                if cancelled.is_set():
+                    raise VQECancelled()
+                feed.push(eval_count, value)
             
-            # Run VQE with callback
-            vqe_result = engine.run_vqe_with_streaming_callback(max_iter=max_iter, callback=streaming_callback)
+            def run_optimization():
+                try:
+                    # The cached engine's iteration state is shared, so runs are serialized
+                    with engine.lock:
+                        outcome['result'] = engine.run_vqe_with_streaming_callback(max_iter=max_iter, callback=streaming_callback)
+                        outcome['trace'] = engine.energy_trace
+                finally:
+                    feed.close()
             
+            worker = Thread(target=run_optimization, daemon=True)
+            worker.start()
+            
+            try:
+                for batch in feed.batches():
+                    # Evaluation counts can exceed max_iter, so cap progress below the next step
+                    yield b''.join(
+                        iteration_frame % (eval_count, energy, 50 + min(39, int((eval_count / max_iter) * 40)))
+                        for eval_count, energy in batch
+                    )
+            finally:
+                # Client went away (or we finished): stop the optimizer at its next evaluation
+                cancelled.set()
+            
+            vqe_result = outcome['result']
             if not vqe_result['success']:
-                yield f"data: {json.dumps({'error': vqe_result['error']})}\n\n"
+                yield sse_frame({'error': vqe_result['error']})
                 return
             
-            # Send all iteration data
-            for i, iter_data in enumerate(vqe_result['iterations']):
-                progress = 50 + int((i / len(vqe_result['iterations'])) * 40)
-                yield f"data: {json.dumps({'step': 'vqe', 'status': 'iterating', 'data': {'iteration': iter_data['iteration'], 'energy': iter_data['energy']}, 'progress': progress})}\n\n"
-                time.sleep(0.05)  # Small delay for smooth animation
-            
-            yield f"data: {json.dumps({'step': 'vqe', 'status': 'complete', 'data': {'num_iterations': vqe_result['num_iterations'], 'final_energy': vqe_result['vqe_energy']}, 'progress': 90})}\n\n"
-            time.sleep(0.5)
+            yield sse_frame({'step': 'vqe', 'status': 'complete', 'data': {'num_iterations': vqe_result['num_iterations'], 'final_energy': vqe_result['vqe_energy']}, 'progress': 90})
             
             # STEP 5: Generate Final Results
-            yield f"data: {json.dumps({'step': 'results', 'status': 'running', 'message': 'Generating plots and analysis...', 'progress': 92})}\n\n"
+            yield frames['results']
             
             # Generate energy plot
-            energy_path = os.path.join(STATIC_DIR, f'{molecule_name}_energy.png')
-            engine.generate_energy_plot(energy_path)
+            energy_path = f'{_PLOT_PREFIX}{molecule_name}_energy.png'
+            engine.generate_energy_plot(energy_path, trace=outcome['trace'])
             
             # Calculate error
-            error_percentage = abs((vqe_result['vqe_energy'] - ham_result['classical_energy']) / ham_result['classical_energy'] * 100)
+            error_percentage = VQEService.error_percentage(vqe_result['vqe_energy'], ham_result['classical_energy'])
             
             final_results = {
                 'molecule': molecule_name,
                 'vqe_energy': vqe_result['vqe_energy'],
                 'classical_energy': ham_result['classical_energy'],
+                'exact_energy': ham_result['exact_energy'],
                 'num_iterations': vqe_result['num_iterations'],
                 'error_percentage': error_percentage,
                 'iterations': vqe_result['iterations'],
@@ -589,13 +936,17 @@ def run_vqe_stream(molecule_name):
                 'energy_plot': f'/static/plots/{molecule_name}_energy.png'
             }
             
-            yield f"data: {json.dumps({'step': 'results', 'status': 'complete', 'data': final_results, 'progress': 100})}\n\n"
+            yield sse_frame({'step': 'results', 'status': 'complete', 'data': final_results, 'progress': 100})
             
             logger.info(f"VQE stream completed for {molecule_name}")
             
+        except GeneratorExit:
+            # Client disconnected; the worker stops (releasing engine.lock) at its next evaluation
+            logger.info("VQE stream for %s closed by client", molecule_name)
+            raise
         except Exception as e:
             logger.error(f"Error in VQE stream: {str(e)}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_frame({'error': str(e)})
     
     return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
@@ -603,4 +954,7 @@ def run_vqe_stream(molecule_name):
 if __name__ == '__main__':
     print("🚀 Starting Quantum Molecule Energy Estimator API...")
     print("📡 Backend running on http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
+    Thread(target=_prewarm_engines, daemon=True).start()
+    app.run(host='0.0.0.0', port=5000,
+            debug=bool(os.environ.get('FLASK_DEBUG')),
+            use_reloader=False, threaded=True)
@@ -0,0 +1,55 @@
+"""
+Analytics Service - Summary statistics for VQE convergence traces
+"""
+
+import numpy as np
+import math
+
+
+class AnalyticsService:
+    """Service for analysing VQE energy traces"""
+    
+    @staticmethod
+    def summarize(energies):
+        """Compute convergence statistics for a float64 energy trace"""
+        n = energies.size
+        
+        # One O(n) partition gives min, max and median; one centred dot product gives the variance
+        mid_low, mid_high = (n - 1) // 2, n // 2
+        ordered = np.partition(energies, sorted({0, mid_low, mid_high, n - 1}))
+        min_energy = ordered[0]
+        max_energy = ordered[-1]
+        median_energy = 0.5 * (ordered[mid_low] + ordered[mid_high])
+        
+        mean_energy = energies.mean()
+        centered = energies - mean_energy
+        variance = float(centered @ centered) / n
+        
+        analytics = {
+            'mean_energy': float(mean_energy),
+            'std_deviation': math.sqrt(variance),
+            'variance': variance,
+            'min_energy': float(min_energy),
+            'max_energy': float(max_energy),
+            'energy_range': float(max_energy - min_energy),
+            'convergence_rate': None,
+            'final_gradient': None,
+            'median_energy': float(median_energy),
+            'energy_improvement': None
+        }
+        
+        # Calculate convergence rate (last 10% of iterations) on a view of the trace
+        if n > 10:
+            tail = energies[n - (n + 9) // 10:]  # last ceil(n/10) samples
+            tail_centered = tail - tail.mean()
+            analytics['convergence_rate'] = math.sqrt(float(tail_centered @ tail_centered) / tail.size)
+        
+        # Estimate gradient
+        if n > 2:
+            analytics['final_gradient'] = float(energies[-1] - energies[-2])
+        
+        # Calculate energy improvement
+        if n > 1:
+            analytics['energy_improvement'] = float(energies[0] - energies[-1])
+        
+        return analytics
@@ -0,0 +1,63 @@
+"""
+Engine Service - Process-wide registry of engines with their Hamiltonians built
+"""
+
+from quantum_engine import QuantumMoleculeEngine
+from collections import OrderedDict
+from threading import Lock
+
+
+class EngineService:
+    """Shares one QuantumMoleculeEngine per geometry across endpoints and services"""
+    
+    CACHE_SIZE = 16
+    
+    _engines = OrderedDict()
+    _lock = Lock()
+    _build_locks = {}  # Per-key locks so different geometries build concurrently
+    
+    @staticmethod
+    def _build(molecule_name, bond_length):
+        """Construct an engine and build its Hamiltonian once"""
+        engine = QuantumMoleculeEngine(molecule_name)
+        if bond_length is not None and bond_length != engine.molecule_data['bond_length']:
+            engine._set_bond_length(bond_length)
+            engine.molecule_data['bond_length'] = bond_length
+        
+        ham_result = engine.build_hamiltonian()
+        if not ham_result['success']:
+            raise RuntimeError(f"Failed to build Hamiltonian for {molecule_name}: {ham_result['error']}")
+        engine.ham_result = ham_result
+        return engine
+    
+    @staticmethod
+    def get(molecule_name, bond_length=None):
+        """Return the shared engine for a molecule geometry, building it on first use
+        
+        bond_length=None means the molecule's equilibrium geometry. Runs that reset
+        iteration state on the engine must hold engine.lock.
+        """
+        key = (molecule_name, bond_length)
+        
+        with EngineService._lock:
+            engine = EngineService._engines.get(key)
+            if engine is not None:
+                EngineService._engines.move_to_end(key)
+                return engine
+            build_lock = EngineService._build_locks.setdefault(key, Lock())
+        
+        # Build outside the registry lock; concurrent callers for the same key wait here
+        with build_lock:
+            with EngineService._lock:
+                engine = EngineService._engines.get(key)
+            if engine is None:
+                try:
+                    engine = EngineService._build(molecule_name, bond_length)
+                    with EngineService._lock:
+                        EngineService._engines[key] = engine
+                        if len(EngineService._engines) > EngineService.CACHE_SIZE:
+                            EngineService._engines.popitem(last=False)
+                finally:
+                    with EngineService._lock:
+                        EngineService._build_locks.pop(key, None)
+            return engine
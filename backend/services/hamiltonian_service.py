@@ -2,29 +2,48 @@
 Hamiltonian Service - Handles Hamiltonian generation and storage
 """
 
-from quantum_engine import QuantumMoleculeEngine
-import json
+from quantum_engine import QuantumMoleculeEngine, cache_hamiltonian_state
+from services.engine_service import EngineService
+from functools import lru_cache
+import hashlib
+import mmap
 import os
+import pickle
+import tempfile
+import qiskit
 
 
 class HamiltonianService:
     """Service for managing molecular Hamiltonians"""
     
+    # Bump when the mapper, ansatz or pickled state changes; with the Qiskit version
+    # it is part of the file name, so pickles from older code are never read
+    FORMAT_VERSION = 1
+    
+    @staticmethod
+    def _cache_path(engine, directory):
+        """Pickle path keyed by a hash of everything the Hamiltonian depends on"""
+        tag = (HamiltonianService.FORMAT_VERSION, qiskit.__version__, engine.hamiltonian_key)
+        digest = hashlib.sha1(repr(tag).encode()).hexdigest()
+        return os.path.join(directory, f'{engine.molecule_name}_{digest}.pkl')
+    
     @staticmethod
     def generate_and_save(molecule_name, output_dir='hamiltonians'):
-        """Generate Hamiltonian and save to JSON"""
-        engine = QuantumMoleculeEngine(molecule_name)
+        """Generate Hamiltonian and pickle the qubit operator and energies"""
+        try:
+            engine = EngineService.get(molecule_name)
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+        result = engine.ham_result
         
-        result = engine.build_hamiltonian()
-        if not result['success']:
-            return result
-        
-        # Save to JSON
+        # Write to a temporary file and rename, so readers never see a partial pickle
         os.makedirs(output_dir, exist_ok=True)
-        filepath = os.path.join(output_dir, f'{molecule_name}_hamiltonian.json')
-        
-        with open(filepath, 'w') as f:
-            json.dump(result, f, indent=2)
+        filepath = HamiltonianService._cache_path(engine, output_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'key': engine.hamiltonian_key, 'state': engine.hamiltonian_state()},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, filepath)
         
         return {
             'success': True,
@@ -32,16 +51,53 @@ class HamiltonianService:
             'data': result
         }
     
+    @staticmethod
+    def ensure(molecule_name, input_dir='hamiltonians'):
+        """Load (or generate) the Hamiltonian and return the shared engine holding it"""
+        result = HamiltonianService.load_hamiltonian(molecule_name, input_dir)
+        if not result['success']:
+            return {'success': False, 'error': result['error']}
+        return {'success': True, 'engine': EngineService.get(molecule_name)}
+    
     @staticmethod
     def load_hamiltonian(molecule_name, input_dir='hamiltonians'):
-        """Load precomputed Hamiltonian"""
-        filepath = os.path.join(input_dir, f'{molecule_name}_hamiltonian.json')
+        """Load precomputed Hamiltonian (memoized per molecule and directory)"""
+        result = HamiltonianService._load_hamiltonian_cached(molecule_name, input_dir)
+        if not result['success']:
+            # Don't keep failed builds around
+            HamiltonianService._load_hamiltonian_cached.cache_clear()
+        return result
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_hamiltonian_cached(molecule_name, input_dir):
+        """Read the pickled Hamiltonian from disk, generating it if missing or unreadable
         
-        if not os.path.exists(filepath):
-            # Generate if not exists
-            return HamiltonianService.generate_and_save(molecule_name, input_dir)
+        A hit seeds the engine's in-process cache and builds the shared engine from it,
+        so nothing downstream pays for PySCF or the qubit mapping again.
+        """
+        engine = QuantumMoleculeEngine(molecule_name)
+        filepath = HamiltonianService._cache_path(engine, input_dir)
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        try:
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                cached = pickle.load(view)
+            if cached['key'] != engine.hamiltonian_key:
+                raise ValueError(f'{filepath} holds a different Hamiltonian')
+        except FileNotFoundError:
+            return HamiltonianService.generate_and_save(molecule_name, input_dir)
+        except Exception:
+            # Truncated, or written by incompatible code (unpickling then fails in many
+            # ways); drop it and regenerate rather than failing every request
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            return HamiltonianService.generate_and_save(molecule_name, input_dir)
         
-        return {'success': True, 'data': data}
+        cache_hamiltonian_state(cached['key'], cached['state'])
+        try:
+            result = EngineService.get(molecule_name).ham_result
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+        return {'success': True, 'filepath': filepath, 'data': result}
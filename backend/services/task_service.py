@@ -0,0 +1,53 @@
+"""
+Task Service - Runs long VQE jobs in the background and tracks their results
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from threading import Lock
+import uuid
+
+
+class TaskService:
+    """Service for background execution of long-running simulations"""
+    
+    MAX_TRACKED_TASKS = 100
+    
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='vqe-task')
+    _tasks = OrderedDict()
+    _lock = Lock()
+    
+    @staticmethod
+    def submit(fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) and return its task id"""
+        task_id = uuid.uuid4().hex
+        future = TaskService._executor.submit(fn, *args, **kwargs)
+        
+        with TaskService._lock:
+            TaskService._tasks[task_id] = future
+            # Forget the oldest finished tasks once the table is full
+            while len(TaskService._tasks) > TaskService.MAX_TRACKED_TASKS:
+                oldest_id, oldest = next(iter(TaskService._tasks.items()))
+                if not oldest.done():
+                    break
+                del TaskService._tasks[oldest_id]
+        
+        return task_id
+    
+    @staticmethod
+    def get_status(task_id):
+        """Return the status (and result, once finished) of a task"""
+        with TaskService._lock:
+            future = TaskService._tasks.get(task_id)
+        
+        if future is None:
+            return None
+        if future.running():
+            return {'task_id': task_id, 'status': 'running'}
+        if not future.done():
+            return {'task_id': task_id, 'status': 'pending'}
+        
+        error = future.exception()
+        if error is not None:
+            return {'task_id': task_id, 'status': 'failed', 'error': str(error)}
+        return {'task_id': task_id, 'status': 'complete', 'result': future.result()}
@@ -2,25 +2,64 @@
 VQE Service - Handles VQE computations
 """
 
-from quantum_engine import QuantumMoleculeEngine
+from services.hamiltonian_service import HamiltonianService
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
 import os
 
 
 class VQEService:
     """Service for running VQE simulations"""
     
+    # Plots are drawn off the request path; serving a plot waits for its pending render
+    _render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot-render')
+    _pending_renders = {}
+    _lock = Lock()
+    
+    @staticmethod
+    def _render_in_background(render, path):
+        """Queue render(path) and track it until the file is written"""
+        key = os.path.abspath(path)
+        future = VQEService._render_executor.submit(render, path)
+        with VQEService._lock:
+            VQEService._pending_renders[key] = future
+        future.add_done_callback(lambda done: VQEService._forget_render(key, done))
+    
+    @staticmethod
+    def _forget_render(key, future):
+        with VQEService._lock:
+            if VQEService._pending_renders.get(key) is future:
+                del VQEService._pending_renders[key]
+    
     @staticmethod
-    def run_simulation(molecule_name, output_dir='static/plots', max_iter=100):
+    def wait_for_render(path, timeout=30):
+        """Block until a queued render of path, if any, has finished"""
+        with VQEService._lock:
+            future = VQEService._pending_renders.get(os.path.abspath(path))
+        if future is not None:
+            future.result(timeout=timeout)
+    
+    @staticmethod
+    def error_percentage(vqe_energy, classical_energy):
+        """Relative VQE error against the classical energy, in percent (0 if that energy is 0)"""
+        if classical_energy == 0:
+            return 0.0
+        return abs((vqe_energy - classical_energy) / classical_energy) * 100.0
+    
+    @staticmethod
+    def run_simulation(molecule_name, output_dir='static/plots', max_iter=100, hamiltonian_dir='hamiltonians'):
         """Run complete VQE simulation"""
-        engine = QuantumMoleculeEngine(molecule_name)
-        
-        # Build Hamiltonian
-        ham_result = engine.build_hamiltonian()
-        if not ham_result['success']:
-            return {'success': False, 'error': ham_result['error']}
+        # Reuses the engine the Hamiltonian was loaded (or generated) into
+        ensured = HamiltonianService.ensure(molecule_name, hamiltonian_dir)
+        if not ensured['success']:
+            return {'success': False, 'error': ensured['error']}
+        engine = ensured['engine']
         
-        # Run VQE
-        vqe_result = engine.run_vqe(max_iter=max_iter)
+        # The shared engine's iteration state is reset per run, so runs are serialized
+        with engine.lock:
+            vqe_result = engine.run_vqe(max_iter=max_iter)
+            trace = engine.energy_trace
         if not vqe_result['success']:
             return {'success': False, 'error': vqe_result['error']}
         
@@ -30,17 +69,18 @@ class VQEService:
         circuit_path = os.path.join(output_dir, f'{molecule_name}_circuit.png')
         energy_path = os.path.join(output_dir, f'{molecule_name}_energy.png')
         
-        engine.generate_circuit_image(circuit_path)
-        engine.generate_energy_plot(energy_path)
+        VQEService._render_in_background(engine.generate_circuit_image, circuit_path)
+        VQEService._render_in_background(partial(engine.generate_energy_plot, trace=trace), energy_path)
         
         return {
             'success': True,
             'molecule': molecule_name,
             'vqe_energy': vqe_result['vqe_energy'],
             'classical_energy': vqe_result['classical_energy'],
+            'exact_energy': vqe_result['exact_energy'],
             'num_iterations': vqe_result['num_iterations'],
             'iterations': vqe_result['iterations'],
             'circuit_image': f'/static/plots/{molecule_name}_circuit.png',
             'energy_plot': f'/static/plots/{molecule_name}_energy.png',
-            'error_percentage': abs((vqe_result['vqe_energy'] - vqe_result['classical_energy']) / vqe_result['classical_energy'] * 100)
+            'error_percentage': VQEService.error_percentage(vqe_result['vqe_energy'], vqe_result['classical_energy'])
         }
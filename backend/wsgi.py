@@ -0,0 +1,21 @@
+"""
+WSGI entry point for production servers
+
+    gunicorn -k gthread --workers 4 --threads 4 --timeout 600 wsgi:app
+
+Set GEVENT=1 to monkey-patch the standard library with gevent before the app is
+imported (for servers other than gunicorn's gevent worker, which patches itself).
+"""
+
+import os
+
+if os.environ.get('GEVENT'):
+    from gevent import monkey
+    monkey.patch_all()
+
+from threading import Thread
+
+from app import app, _prewarm_engines
+
+# Each worker process warms its own engine cache in the background
+Thread(target=_prewarm_engines, daemon=True).start()
@@ -76,6 +76,14 @@ const AdvancedAnalytics = () => {
     
     try {
       const response = await api.exportResults({ format: exportFormat, results });
+      const disposition = response.headers['content-disposition'] || '';
+      const match = disposition.match(/filename=([^;]+)/);
+      const url = URL.createObjectURL(response.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = match ? match[1] : `vqe_results.${exportFormat}`;
+      link.click();
+      URL.revokeObjectURL(url);
       showToast(`Results exported as ${exportFormat.toUpperCase()}`, 'success');
       setShowModal(false);
     } catch (error) {
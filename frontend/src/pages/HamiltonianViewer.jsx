@@ -90,7 +90,7 @@ const HamiltonianViewer = () => {
           <Card title="Pauli Decomposition" icon={FiGrid}>
             <div className="mb-4 bg-blue-900/20 border border-blue-800 rounded-lg p-4">
               <p className="text-sm text-blue-300">
-                <span className="font-semibold">Explanation:</span> The molecular Hamiltonian is mapped to qubit operators using the Jordan-Wigner transformation. Each Pauli term represents electron interactions in the qubit space.
+                <span className="font-semibold">Explanation:</span> The molecular Hamiltonian is mapped to qubit operators using the parity transformation, with two qubits removed by particle-number symmetry. Each Pauli term represents electron interactions in the qubit space.
               </p>
             </div>
             
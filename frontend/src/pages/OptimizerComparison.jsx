@@ -29,7 +29,8 @@ const OptimizerComparison = () => {
     const colors = {
       'SLSQP': 'rgb(59, 130, 246)',
       'COBYLA': 'rgb(168, 85, 247)',
-      'SPSA': 'rgb(16, 185, 129)'
+      'SPSA': 'rgb(16, 185, 129)',
+      'Adam-SPSA': 'rgb(245, 158, 11)'
     };
 
     const datasets = Object.keys(results.optimizers).map(optName => ({
@@ -93,7 +94,7 @@ const OptimizerComparison = () => {
     <div className="space-y-6">
       <div>
         <h1 className="text-4xl font-bold text-white mb-2">Optimizer Comparison</h1>
-        <p className="text-gray-400 text-lg">Compare SLSQP, COBYLA, and SPSA optimizers</p>
+        <p className="text-gray-400 text-lg">Compare SLSQP, COBYLA, SPSA and Adam-SPSA optimizers</p>
       </div>
 
       <Card title="Run Comparison" icon={FiZap}>
@@ -123,11 +124,11 @@ const OptimizerComparison = () => {
         </div>
       </Card>
 
-      {running && <LoadingSpinner message="Running VQE with 3 optimizers..." />}
+      {running && <LoadingSpinner message="Running VQE with 4 optimizers..." />}
 
       {results && !running && (
         <>
-          <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+          <div className="grid grid-cols-1 md:grid-cols-2 xl:grid-cols-4 gap-6">
             {Object.keys(results.optimizers).map((optName) => {
               const opt = results.optimizers[optName];
               const error = Math.abs((opt.energy - results.classical_energy) / results.classical_energy * 100);
@@ -162,7 +163,7 @@ const OptimizerComparison = () => {
             <div className="space-y-4">
               <div className="bg-blue-900/20 border border-blue-800 rounded-lg p-4">
                 <p className="text-sm text-blue-300">
-                  <span className="font-semibold">Analysis:</span> Compare convergence behavior of gradient-based (SLSQP), derivative-free (COBYLA), and stochastic (SPSA) optimizers. Each has different strengths for quantum optimization landscapes.
+                  <span className="font-semibold">Analysis:</span> Compare convergence behavior of gradient-based (SLSQP), derivative-free (COBYLA), and stochastic (SPSA, Adam-SPSA) optimizers. Each has different strengths for quantum optimization landscapes.
                 </p>
               </div>
 
@@ -61,7 +61,7 @@ const Overview = () => {
               <div className="flex-1 bg-gradient-to-r from-purple-600 to-purple-500 p-4 rounded-lg text-center">
                 <div className="text-2xl mb-2">⚛️</div>
                 <div className="font-semibold text-white">Hamiltonian</div>
-                <div className="text-xs text-purple-100 mt-1">Jordan-Wigner mapping</div>
+                <div className="text-xs text-purple-100 mt-1">Parity mapping</div>
               </div>
               
               <div className="text-2xl text-gray-600">→</div>
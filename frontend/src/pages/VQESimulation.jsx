@@ -45,7 +45,7 @@ const VQESimulation = () => {
 
   const stages = [
     { id: 0, name: 'Setup', icon: FiZap, description: 'Configure molecule and parameters' },
-    { id: 1, name: 'Hamiltonian Mapping', icon: FiActivity, description: 'Jordan-Wigner transformation to qubits' },
+    { id: 1, name: 'Hamiltonian Mapping', icon: FiActivity, description: 'Parity transformation to qubits' },
     { id: 2, name: 'Circuit Construction', icon: FiImage, description: 'Build variational quantum circuit' },
     { id: 3, name: 'VQE Optimization', icon: FiLoader, description: 'Iterative energy minimization' },
     { id: 4, name: 'Results', icon: FiCheckCircle, description: 'Final ground state energy' }
@@ -299,7 +299,7 @@ const VQESimulation = () => {
 
       {/* Stage 1: Hamiltonian Mapping */}
       {currentStage >= 1 && stageData.hamiltonian && (
-        <Card title="Stage 1: Hamiltonian Mapping (Jordan-Wigner)" icon={FiActivity}>
+        <Card title="Stage 1: Hamiltonian Mapping (Parity)" icon={FiActivity}>
           <div className="space-y-4">
             <div className="grid md:grid-cols-3 gap-4">
               <div className="bg-gray-900 p-4 rounded-lg">
@@ -334,7 +334,7 @@ const VQESimulationRealTime = () => {
 
       {/* Hamiltonian Data */}
       {hamiltonianData && (
-        <Card title="✓ Hamiltonian Mapped (Jordan-Wigner)" icon={FiActivity}>
+        <Card title="✓ Hamiltonian Mapped (Parity)" icon={FiActivity}>
           <div className="space-y-4">
             <div className="grid md:grid-cols-3 gap-4">
               <div className="bg-gray-900 p-4 rounded-lg">
@@ -27,7 +27,7 @@ export const api = {
   runVQEStream: (moleculeName, params, onMessage, onError, onComplete) => {
     // SSE only supports GET, so pass params via URL query string
     const maxIter = params?.max_iter || 100;
-    const url = `${API_BASE_URL}/run-vqe-stream/${moleculeName}?max_iter=${maxIter}`;
+    const url = `${API_BASE_URL}/run-vqe-stream/${moleculeName}?max_iter=${maxIter}&compact=1`;
     
     // Create EventSource for Server-Sent Events
     const eventSource = new EventSource(url);
@@ -53,6 +53,12 @@ export const api = {
       }
     };
     
+    // Compact iteration frames: "iteration,energy,progress"
+    eventSource.addEventListener('iteration', (event) => {
+      const [iteration, energy, progress] = event.data.split(',').map(Number);
+      onMessage({ step: 'vqe', status: 'iterating', data: { iteration, energy }, progress });
+    });
+    
     eventSource.onerror = (error) => {
       console.error('SSE connection error:', error);
       onError('Connection to server lost');
@@ -87,7 +93,8 @@ export const api = {
 
   // Export results
   exportResults: (data) => axios.post(`${API_BASE_URL}/export-results`, data, {
-    headers: { 'Content-Type': 'application/json' }
+    headers: { 'Content-Type': 'application/json' },
+    responseType: 'blob'
   }),
 
   // Get static file URL